@@ -1,11 +1,20 @@
 import random
 import os
-import asyncio
+import re
+import ctypes
+import signal
 import time
 import sys
 import termios
 import tty
 
+import numpy as np
+
+try:
+    from numba import njit, prange, get_num_threads
+except ImportError: # Optional: without Numba the NumPy path is used
+    njit = None
+
 # ANSI escape codes (no longer used directly in rendering string)
 # CLEAR_SCREEN = "\033[H\033[J"
 
@@ -30,6 +39,7 @@ RENDER_OTHER_PLAYER = "●"  # Dot for other players
 
 # Screen handling codes
 CLEAR_SCREEN = "\033[2J\033[H"  # Clear screen and move cursor to top
+CURSOR_HOME = "\033[H"  # Move cursor to top without clearing
 CLEAR_LINE = "\033[K"  # Clear current line
 CLEAR_TO_END = "\033[J"  # Clear from cursor to end of screen
 CLEAR_ALL = "\033[2J\033[H\033[3J"  # Clear screen, scrollback buffer, and move cursor to top
@@ -40,50 +50,375 @@ RESTORE_CURSOR = "\033[u"  # Restore cursor position
 MOVE_CURSOR = "\033[{};{}H"  # Move cursor to position (row, col)
 DISABLE_LINE_WRAP = "\033[?7l"  # Disable line wrapping
 ENABLE_LINE_WRAP = "\033[?7h"  # Enable line wrapping
+RENDER_LINE_END = CLEAR_LINE + "\n"  # Clear leftovers of the previous frame, then newline
+
+# The viewport is assembled as UTF-32 code points (each glyph is one character)
+# in a reusable frame buffer and decoded to a str in one call
+VIEW_CODEPOINT_DEAD = ord(RENDER_DEAD)
+VIEW_CODEPOINT_LIVE = ord(RENDER_LIVE)
+VIEW_CODEPOINT_PLAYER = ord(RENDER_PLAYER)
+VIEW_CODEPOINT_OTHER = ord(RENDER_OTHER_PLAYER)
+VIEW_LINE_END_CODEPOINTS = [ord(ch) for ch in RENDER_LINE_END]
+VIEW_INDEX_CACHE_SIZE = 64 # Distinct viewport origins kept before the index cache is reset
+RENDER_FULL_FRAME_INTERVAL = 50 # Frames between full repaints while sending viewport diffs
+# CSI escape sequences (colors, cursor moves, line clears); they take no columns
+_ANSI_ESCAPE = re.compile(r"\033\[[0-9;?]*[A-Za-z]")
+
+# Status text that never changes between frames, with line ends already applied
+STATUS_TITLE = f"{RENDER_LINE_END}{COLOR_BOLD}Game of Life - Multiplayer Edition{COLOR_RESET}"
+STATUS_LEGEND = f"{RENDER_LINE_END}Legend: {RENDER_DEAD}=Empty {RENDER_LIVE}=Live {RENDER_PLAYER}=You {RENDER_OTHER_PLAYER}=Other"
+STATUS_KEYS = f"{RENDER_LINE_END}Keys: r=respawn | q=quit{RENDER_LINE_END}"
+STATUS_KEYS_DEBUG = f"{RENDER_LINE_END}Keys: r=respawn | q=quit | h=hot reload{RENDER_LINE_END}"
+STATUS_LEADERBOARD_TITLE = f"{RENDER_LINE_END}Top 3 Players:"
+STATUS_COMMAND_PROMPT = f"{RENDER_LINE_END}Enter command: "
 
 # Internal grid states
 INTERNAL_DEAD = 0
 INTERNAL_LIVE = -1 # Use negative to distinguish from player IDs >= 1
+GRID_DTYPE = np.int16 # Signed so INTERNAL_LIVE and player IDs share one array
+MAX_PLAYER_ID = int(np.iinfo(GRID_DTYPE).max) # Largest ID a grid cell can hold
 
 # --- Player Spawn Pattern (Glider) ---
 # Standard Glider shape relative coordinates
 # . @ .
 # . . @
 # @ @ @
-PLAYER_SPAWN_PATTERN = [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)] 
+# Stored as (N, 2) arrays of (dr, dc) so a pattern is placed with one fancy-indexed write
+PLAYER_SPAWN_PATTERN = np.array([(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)], dtype=np.intp)
 PATTERN_WIDTH = 3 # Max width of glider pattern
 PATTERN_HEIGHT = 3 # Max height of glider pattern
+# Hashable copy of the footprint for the disruption placement check
+_SPAWN_OFFSET_SET = frozenset(map(tuple, PLAYER_SPAWN_PATTERN.tolist()))
 # --- End Player Spawn Pattern ---
 
 # --- Standard Patterns for Seeding ---
 STANDARD_PATTERNS = {
-    "block": [(0, 0), (0, 1), (1, 0), (1, 1)],
-    "blinker_h": [(0,0), (0,1), (0,2)], # Horizontal Blinker (period 2 oscillator)
-    "lwss": [(0,1), (0,4), (1,0), (2,0), (2,4), (3,0), (3,1), (3,2), (3,3)], # LightWeight SpaceShip
-    "glider": [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)], # Add glider back as a pattern
-    "beacon": [(0,0), (0,1), (1,0), (1,1), (2,2), (2,3), (3,2), (3,3)], # Beacon pattern
-    "toad": [(0,1), (0,2), (0,3), (1,0), (1,1), (1,2)] # Toad pattern
-}
-STANDARD_PATTERN_DIMS = {
-    "block": (2, 2),
-    "blinker_h": (1, 3),
-    "lwss": (4, 5),
-    "glider": (3, 3),
-    "beacon": (4, 4),
-    "toad": (2, 4)
+    "block": np.array([(0, 0), (0, 1), (1, 0), (1, 1)], dtype=np.intp),
+    "blinker_h": np.array([(0,0), (0,1), (0,2)], dtype=np.intp), # Horizontal Blinker (period 2 oscillator)
+    "lwss": np.array([(0,1), (0,4), (1,0), (2,0), (2,4), (3,0), (3,1), (3,2), (3,3)], dtype=np.intp), # LightWeight SpaceShip
+    "glider": np.array([(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)], dtype=np.intp), # Add glider back as a pattern
+    "beacon": np.array([(0,0), (0,1), (1,0), (1,1), (2,2), (2,3), (3,2), (3,3)], dtype=np.intp), # Beacon pattern
+    "toad": np.array([(0,1), (0,2), (0,3), (1,0), (1,1), (1,2)], dtype=np.intp) # Toad pattern
 }
+# (height, width) of each pattern's bounding box, derived from its offsets
+STANDARD_PATTERN_DIMS = {name: tuple(int(d) for d in coords.max(axis=0) + 1)
+                         for name, coords in STANDARD_PATTERNS.items()}
 # --- End Standard Patterns ---
 
 # --- Game Constants ---
 RESPAWN_COOLDOWN = 15 # Seconds
+RESPAWN_MAX_OFFSET = 5 # Maximum distance to try from the current position
+# Respawn candidates around the current position, in search order: square
+# shells of growing offset, each visiting the 8 compass points
+RESPAWN_OFFSETS = np.array([(dr, dc)
+                            for offset in range(1, RESPAWN_MAX_OFFSET + 1)
+                            for dr in (-offset, 0, offset)
+                            for dc in (-offset, 0, offset)
+                            if dr or dc], dtype=np.intp)
 # --- End Game Constants ---
 
+# Timestamps for cooldowns; the same clock asyncio's default loop.time() reads,
+# so values are comparable with the server's and valid outside a running loop
+_monotonic = time.monotonic
+
+# Row/column offsets of the eight surrounding cells
+_NEIGHBOR_DR = np.array([-1, -1, -1, 0, 0, 1, 1, 1])
+_NEIGHBOR_DC = np.array([-1, 0, 1, -1, 1, -1, 0, 1])
+
+def _single_player_influence(grid, neighbor_rows, neighbor_cols):
+    """Finds cells that have live neighbors from exactly one player.
+
+    Player cells are a small fraction of the board, so instead of sweeping
+    the whole grid per player this scatters each player cell onto its eight
+    neighbors. `neighbor_rows` (H, 8) holds the wrapped flat row offsets and
+    `neighbor_cols` (W, 8) the wrapped columns of each cell's neighbors.
+    Returns (flat cell indices, influencing player IDs).
+    """
+    player_r, player_c = np.nonzero(grid > 0)
+    if player_r.size == 0:
+        return player_r, player_r
+    pids = grid[player_r, player_c].astype(np.int64)
+    targets = (neighbor_rows[player_r] + neighbor_cols[player_c]).ravel()
+    # Distinct (target, player) pairs, then targets reached by one player only.
+    # Deduplicated by sorting: np.unique's hash path is several times slower here
+    key_scale = int(pids.max()) + 1
+    keys = targets * key_scale + np.repeat(pids, 8)
+    keys.sort()
+    distinct = np.empty(keys.size, dtype=bool)
+    distinct[0] = True
+    np.not_equal(keys[1:], keys[:-1], out=distinct[1:])
+    pairs = keys[distinct]
+    # Pairs are sorted by target, so a lone target differs from both neighbors
+    pair_targets = pairs // key_scale
+    edges = np.ones(pair_targets.size + 1, dtype=bool)
+    np.not_equal(pair_targets[1:], pair_targets[:-1], out=edges[1:-1])
+    single = edges[:-1] & edges[1:]
+    return pair_targets[single], pairs[single] % key_scale
+
+def _mark_near(mask, r, c, distance):
+    """Sets every cell of `mask` less than `distance` away from (r, c) on both axes."""
+    mask[max(r - distance + 1, 0):r + distance, max(c - distance + 1, 0):c + distance] = True
+
+# --- Bit-packed (SWAR) rule evaluation ---
+# Alive cells are packed 64 per uint64 word (bit k of word i is padded column
+# 64*i + k) so the neighbor count for a whole word is a few bitwise ops.
+_ONE = np.uint64(1)
+_HIGH_BIT = np.uint64(63)
+
+def _pack_rows(mask):
+    """Packs a bool mask row-wise into uint64 words with a one-column wrap halo each side."""
+    height, width = mask.shape
+    words = (width + 2 + 63) // 64
+    padded = np.zeros((height, words * 64), dtype=bool)
+    padded[:, 1:width + 1] = mask
+    padded[:, 0] = mask[:, -1]
+    padded[:, width + 1] = mask[:, 0]
+    return np.packbits(padded, axis=1, bitorder='little').view('<u8')
+
+def _unpack_rows(words, width):
+    """Inverse of _pack_rows: returns the bool mask without the halo columns."""
+    bits = np.unpackbits(words.view(np.uint8), axis=1, bitorder='little')
+    return bits[:, 1:width + 1].view(bool)
+
+def _shift_from_left(words):
+    """Each bit takes the value of its left-hand (column - 1) neighbor."""
+    shifted = words << _ONE
+    shifted[:, 1:] |= words[:, :-1] >> _HIGH_BIT
+    return shifted
+
+def _shift_from_right(words):
+    """Each bit takes the value of its right-hand (column + 1) neighbor."""
+    shifted = words >> _ONE
+    shifted[:, :-1] |= words[:, 1:] << _HIGH_BIT
+    return shifted
+
+def _full_add(a, b, c):
+    """Bitwise full adder: returns (sum, carry) planes."""
+    partial = a ^ b
+    return partial ^ c, (a & b) | (partial & c)
+
+def _next_alive_words(is_live):
+    """Applies Conway's B3/S23 rule to a bool mask, 64 cells per word operation.
+
+    Returns the packed next-generation words; halo and padding bits are junk.
+    """
+    alive = _pack_rows(is_live)
+    left = _shift_from_left(alive)
+    right = _shift_from_right(alive)
+
+    # 2-bit horizontal sums: three cells for the rows above/below, two for the own row
+    row0, row1 = _full_add(left, alive, right)
+    own0, own1 = left ^ right, left & right
+    up0, up1 = np.roll(row0, 1, axis=0), np.roll(row1, 1, axis=0)
+    down0, down1 = np.roll(row0, -1, axis=0), np.roll(row1, -1, axis=0)
+
+    # Add the three 2-bit numbers into a count modulo 8 (bits c0, c1, c2);
+    # a full count of 8 wraps to 0, which the rule treats as dead anyway
+    c0, carry1 = _full_add(up0, own0, down0)
+    twos, carry2 = _full_add(up1, own1, down1)
+    c1 = twos ^ carry1
+    c2 = carry2 ^ (twos & carry1)
+
+    # Alive next if the count is 3, or 2 and already alive
+    return c1 & ~c2 & (c0 | alive)
+
+def _grid_column_bits(width):
+    """Packed (1, words) mask with only the bits of real grid columns set."""
+    words = (width + 2 + 63) // 64
+    columns = np.zeros((1, words * 64), dtype=bool)
+    columns[0, 1:width + 1] = True
+    return np.packbits(columns, axis=1, bitorder='little').view('<u8')
+
+if hasattr(np, 'bitwise_count'):
+    def _popcount(words):
+        """Total set bits, using the per-word POPCNT loop of NumPy >= 2.0."""
+        return int(np.bitwise_count(words).sum())
+else:
+    def _popcount(words):
+        """Total set bits for NumPy releases without np.bitwise_count."""
+        return sum(int(w).bit_count() for w in words.ravel().tolist())
+# --- End Bit-packed rule evaluation ---
+
+# --- Compiled generation step (Numba, optional) ---
+STEP_BLOCK = 64 # Tile edge length (cells) for the compiled step
+if njit is not None:
+    @njit(inline='always')
+    def _tally_neighbor(state, live_count, first_pid, mixed):
+        """Folds one neighbor into the running (count, single player, mixed) tally."""
+        if state != INTERNAL_DEAD:
+            live_count += 1
+            if state > 0:
+                if first_pid == 0:
+                    first_pid = state
+                elif state != first_pid:
+                    mixed = True
+        return live_count, first_pid, mixed
+
+    @njit(inline='always')
+    def _next_cell_state(grid, r, c, r_up, r_down, c_left, c_right):
+        """Returns the next state of cell (r, c) given its wrapped neighbor indices."""
+        live_count, first_pid, mixed = 0, 0, False
+        live_count, first_pid, mixed = _tally_neighbor(grid[r_up, c_left], live_count, first_pid, mixed)
+        live_count, first_pid, mixed = _tally_neighbor(grid[r_up, c], live_count, first_pid, mixed)
+        live_count, first_pid, mixed = _tally_neighbor(grid[r_up, c_right], live_count, first_pid, mixed)
+        live_count, first_pid, mixed = _tally_neighbor(grid[r, c_left], live_count, first_pid, mixed)
+        live_count, first_pid, mixed = _tally_neighbor(grid[r, c_right], live_count, first_pid, mixed)
+        live_count, first_pid, mixed = _tally_neighbor(grid[r_down, c_left], live_count, first_pid, mixed)
+        live_count, first_pid, mixed = _tally_neighbor(grid[r_down, c], live_count, first_pid, mixed)
+        live_count, first_pid, mixed = _tally_neighbor(grid[r_down, c_right], live_count, first_pid, mixed)
+
+        current_state = grid[r, c]
+        if current_state != INTERNAL_DEAD:
+            should_be_alive = live_count == 2 or live_count == 3
+        else:
+            should_be_alive = live_count == 3
+
+        if not should_be_alive:
+            return INTERNAL_DEAD
+        if first_pid != 0 and not mixed:
+            return first_pid # Single player influence claims the cell
+        if current_state != INTERNAL_DEAD:
+            return current_state # Survivor keeps its state
+        return INTERNAL_LIVE # Standard birth
+
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _step_kernel(grid, out, row_above, row_below, col_left, col_right, active_rows, changed_rows, row_live, n_threads):
+        """Writes the generation after `grid` into `out`, same rules as the NumPy path.
+
+        The row/col tables hold the wrapped index of each neighbor row and column.
+        Cells are visited in tiles of up to STEP_BLOCK x STEP_BLOCK so a tile and
+        its halo stay in L1 on large boards. Bands of rows are spread across
+        threads, and a band is shortened below STEP_BLOCK rows when the board
+        is too short to give every thread one (server boards are terminal height).
+        Rows not flagged in `active_rows` had an unchanged neighborhood, so they
+        are copied through; `changed_rows` receives which rows changed state and
+        `row_live` the live cell count of each recomputed row. `n_threads` is
+        numba.get_num_threads(), passed in because reading it inside the kernel
+        would stop the kernel from being cached.
+        """
+        height, width = grid.shape
+        band_rows = min(STEP_BLOCK, max(1, (height + n_threads - 1) // n_threads))
+        n_bands = (height + band_rows - 1) // band_rows
+        for band in prange(n_bands):
+            row_start = band * band_rows
+            row_end = min(row_start + band_rows, height)
+            changed_rows[row_start:row_end] = False
+            for r in range(row_start, row_end):
+                if active_rows[r]:
+                    row_live[r] = 0 # Recount recomputed rows; others keep their count
+            for col_start in range(0, width, STEP_BLOCK):
+                col_end = min(col_start + STEP_BLOCK, width)
+                # Interior columns address neighbors directly (a branch-free loop LLVM
+                # can vectorize); only the two edge columns go through the wrap tables
+                inner_start = max(col_start, 1)
+                inner_end = min(col_end, width - 1)
+                for r in range(row_start, row_end):
+                    if not active_rows[r]:
+                        out[r, col_start:col_end] = grid[r, col_start:col_end]
+                        continue
+                    r_up = row_above[r]
+                    r_down = row_below[r]
+                    changed = False
+                    live = 0
+                    for c in range(inner_start, inner_end):
+                        state = _next_cell_state(grid, r, c, r_up, r_down, c - 1, c + 1)
+                        changed |= state != grid[r, c]
+                        live += state != INTERNAL_DEAD
+                        out[r, c] = state
+                    if col_start == 0:
+                        state = _next_cell_state(grid, r, 0, r_up, r_down, col_left[0], col_right[0])
+                        changed |= state != grid[r, 0]
+                        live += state != INTERNAL_DEAD
+                        out[r, 0] = state
+                    if col_end == width and width > 1:
+                        last = width - 1
+                        state = _next_cell_state(grid, r, last, r_up, r_down, col_left[last], col_right[last])
+                        changed |= state != grid[r, last]
+                        live += state != INTERNAL_DEAD
+                        out[r, last] = state
+                    row_live[r] += live
+                    if changed:
+                        changed_rows[r] = True
+else:
+    _step_kernel = None
+# --- End Compiled generation step ---
+
+# --- Native generation step (C via ctypes, optional) ---
+def _load_stencil_library():
+    """Loads life_stencil.so (built from life_stencil.c) from next to this file, if present."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'life_stencil.so')
+    try:
+        lib = ctypes.CDLL(path)
+    except OSError:
+        return None
+    try:
+        cell_size = ctypes.c_int.in_dll(lib, 'life_cell_size').value
+    except ValueError:
+        cell_size = None
+    if cell_size != np.dtype(GRID_DTYPE).itemsize:
+        print(f"WARN: Ignoring {path}: built for a different grid cell type, rebuild it.")
+        return None
+    lib.life_step.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int, ctypes.c_int]
+    lib.life_step.restype = ctypes.c_longlong
+    return lib
+
+_stencil_lib = _load_stencil_library()
+# --- End Native generation step ---
+
 class GameOfLife:
     def __init__(self, width, height):
         self.width = width
         self.height = height
         # Initialize grid with internal dead state
-        self.grid = [[INTERNAL_DEAD for _ in range(width)] for _ in range(height)]
+        self.grid = np.full((height, width), INTERNAL_DEAD, dtype=GRID_DTYPE)
+        # Buffers rotate every generation: the step writes into _scratch, and
+        # _previous keeps the last generation for cycle detection
+        self._scratch = np.empty_like(self.grid)
+        self._previous = np.empty_like(self.grid)
+        # Reusable bool masks for the NumPy step, so a tick allocates no full-grid masks
+        self._live_mask = np.empty((height, width), dtype=bool)
+        self._mask_buf = np.empty((height, width), dtype=bool)
+        # Wrapped neighbor row/column indices, so the compiled step needs no modulo
+        self._row_above = np.roll(np.arange(height), 1)
+        self._row_below = np.roll(np.arange(height), -1)
+        self._col_left = np.roll(np.arange(width), 1)
+        self._col_right = np.roll(np.arange(width), -1)
+        # Same for the NumPy influence pass: flat row starts and columns of the 8 neighbors
+        self._neighbor_rows = (np.arange(height)[:, None] + _NEIGHBOR_DR) % height * width
+        self._neighbor_cols = (np.arange(width)[:, None] + _NEIGHBOR_DC) % width
+        # Viewport size derived from the terminal; queried lazily and cached
+        self._view_size = None
+        # Wrapped viewport index arrays keyed by (start_r, start_c, height, width)
+        self._view_index_cache = {}
+        self._frame_buffer = None # Viewport code points, see _get_frame_buffer
+        # player_id -> (terminal size, frames since full repaint, viewport code points)
+        # of the last frame sent to that player, for diffing the next one
+        self._last_views = {}
+        # Live cell count cache, set by every step; None means it must be recounted
+        self._live_count = None
+        self._previous_live_count = None # Same for _previous
+        # Cells per player ID (bincount of the grid), built on first use per generation
+        self._player_counts = None
+        self._previous_player_counts = None # Same for _previous
+        # Rows the compiled step must recompute: a row whose own 3 x W neighborhood
+        # did not change last generation keeps its state (see _step_kernel)
+        self._active_rows = np.ones(height, dtype=bool)
+        self._changed_rows = np.zeros(height, dtype=bool)
+        # Live cells per row of the current grid, kept up to date by the compiled step
+        self._row_live = np.zeros(height, dtype=np.int64)
+        # Once the board repeats with period 1 or 2 the step is replaced by a buffer
+        # swap; _clean_steps counts generations since the last direct grid edit
+        self._cycling = False
+        self._clean_steps = 0
+        self._column_bits = _grid_column_bits(width)
+        # Bind the generation step once rather than choosing it on every tick:
+        # prebuilt C library, then Numba, then plain NumPy
+        if _stencil_lib is not None:
+            self._step = self._step_native
+        elif _step_kernel is not None:
+            self._step = self._step_numba
+        else:
+            self._step = self._step_numpy
         # Player state: player_id -> {'pos': (r, c), 'last_respawn_time': timestamp, 'respawn_count': int}
         self.players = {}
         self.generation_count = 0
@@ -91,24 +426,42 @@ class GameOfLife:
         # Use new standard patterns, removed glider as it's player spawn
         self._seed_patterns(num_blocks=5, num_blinkers=5, num_lwss=3) 
 
-    def _is_valid(self, r, c):
-        """Check if coordinates are within grid bounds."""
-        return 0 <= r < self.height and 0 <= c < self.width
-
     def _is_area_clear(self, start_r, start_c, pattern_coords):
         """Checks if the area for a pattern is empty (INTERNAL_DEAD)."""
+        # Modulo wraps every coordinate onto the grid, so one gather covers the check
+        rows = (start_r + pattern_coords[:, 0]) % self.height
+        cols = (start_c + pattern_coords[:, 1]) % self.width
+        return not np.any(self.grid[rows, cols] != INTERNAL_DEAD)
+
+    def _grid_edited(self):
+        """Drops state derived from the grid; call after editing it outside the step."""
+        self._live_count = None
+        self._player_counts = None
+        self._active_rows.fill(True)
+        self._cycling = False
+        self._clean_steps = 0
+
+    def _clear_corners(self, pattern_coords, p_height, p_width):
+        """Mask of top-left corners where the pattern fits in bounds over dead cells only.
+
+        Entry [r, c] is True when _is_area_clear(r, c, pattern_coords) holds, for
+        0 <= r <= height - p_height and 0 <= c <= width - p_width.
+        """
+        is_dead = self.grid == INTERNAL_DEAD
+        corner_rows = self.height - p_height + 1
+        corner_cols = self.width - p_width + 1
+        clear = np.ones((max(corner_rows, 0), max(corner_cols, 0)), dtype=bool)
         for dr, dc in pattern_coords:
-            r, c = (start_r + dr) % self.height, (start_c + dc) % self.width
-            if not self._is_valid(r, c) or self.grid[r][c] != INTERNAL_DEAD:
-                return False
-        return True
+            clear &= is_dead[dr:dr + corner_rows, dc:dc + corner_cols]
+        return clear
 
     def _place_pattern(self, start_r, start_c, pattern_coords, state=INTERNAL_LIVE):
         """Places a pattern using the specified state, assuming area is clear."""
-        for dr, dc in pattern_coords:
-            r, c = (start_r + dr) % self.height, (start_c + dc) % self.width
-            if self._is_valid(r, c):
-                self.grid[r][c] = state
+        # Modulo already wraps every coordinate onto the grid, so no bounds check
+        rows = (start_r + pattern_coords[:, 0]) % self.height
+        cols = (start_c + pattern_coords[:, 1]) % self.width
+        self.grid[rows, cols] = state
+        self._grid_edited()
 
     def _seed_patterns(self, num_blocks=3, num_blinkers=3, num_lwss=2):
         """Seeds the board with a specific number of standard patterns."""
@@ -126,12 +479,19 @@ class GameOfLife:
         max_attempts_per_pattern = 100
 
         for pattern_name, num_to_place in patterns_to_seed:
-            if pattern_name not in STANDARD_PATTERNS:
+            pattern_coords = STANDARD_PATTERNS.get(pattern_name)
+            if pattern_coords is None:
                  print(f"WARN: Pattern '{pattern_name}' not defined in STANDARD_PATTERNS. Skipping.")
                  continue
             
-            pattern_coords = STANDARD_PATTERNS[pattern_name]
             p_height, p_width = STANDARD_PATTERN_DIMS[pattern_name]
+            proximity = max(p_width, p_height) + 4  # Increased minimum distance between patterns
+
+            # Corners closer than `proximity` (on both axes) to a placed pattern; the
+            # distance depends on this pattern's size, so rebuild per pattern type
+            blocked = np.zeros((self.height, self.width), dtype=bool)
+            for pr, pc, _ in placements:
+                _mark_near(blocked, pr, pc, proximity)
             
             placed_count = 0
             for _ in range(num_to_place):
@@ -141,20 +501,15 @@ class GameOfLife:
                     start_r = random.randint(0, self.height - p_height)
                     start_c = random.randint(0, self.width - p_width)
                     
-                    # Basic overlap check with increased spacing
-                    too_close = False
-                    proximity = max(p_width, p_height) + 4  # Increased minimum distance between patterns
-                    for pr, pc, _ in placements:
-                        if abs(start_r - pr) < proximity and abs(start_c - pc) < proximity:
-                            too_close = True
-                            break
-                    if too_close:
+                    # Basic overlap check with increased spacing: one mask lookup
+                    if blocked[start_r, start_c]:
                         attempt += 1
                         continue
                     
                     if self._is_area_clear(start_r, start_c, pattern_coords):
                         self._place_pattern(start_r, start_c, pattern_coords, INTERNAL_LIVE)
                         placements.append((start_r, start_c, pattern_name))
+                        _mark_near(blocked, start_r, start_c, proximity)
                         placed_this_one = True
                         placed_count += 1
                     attempt += 1
@@ -165,32 +520,46 @@ class GameOfLife:
         else:
              print(f"WARN: Failed to seed any patterns.")
 
-    def _get_neighbors_state(self, r, c):
-        """Counts live neighbors and identifies unique player IDs among them."""
-        live_neighbor_count = 0
-        neighbor_player_ids = set()
-
-        for i in range(-1, 2):
-            for j in range(-1, 2):
-                if i == 0 and j == 0:
-                    continue # Skip the cell itself
-
-                # Calculate neighbor coordinates with wrapping
-                nr, nc = (r + i) % self.height, (c + j) % self.width
-
-                neighbor_state = self.grid[nr][nc]
-                if neighbor_state == INTERNAL_LIVE: # Standard live cell
-                    live_neighbor_count += 1
-                elif neighbor_state > 0: # Player cell (ID > 0)
-                    live_neighbor_count += 1
-                    neighbor_player_ids.add(neighbor_state)
-
-        return live_neighbor_count, neighbor_player_ids
+    def _step_native(self, grid, out):
+        """Generation step using the C library (runs without the GIL); writes into `out`."""
+        self._live_count = _stencil_lib.life_step(grid.ctypes.data, out.ctypes.data, self.width, self.height)
+
+    def _step_numba(self, grid, out):
+        """Generation step using the Numba kernel; writes into `out`."""
+        _step_kernel(grid, out, self._row_above, self._row_below, self._col_left, self._col_right,
+                     self._active_rows, self._changed_rows, self._row_live, get_num_threads())
+        self._live_count = int(self._row_live.sum())
+        # Next generation, only rows next to a row that just changed can change
+        changed = self._changed_rows
+        np.logical_or(changed, np.roll(changed, 1), out=self._active_rows)
+        self._active_rows |= np.roll(changed, -1)
+
+    def _step_numpy(self, grid, out):
+        """Vectorized generation step used when Numba is not installed; writes into `out`."""
+        # Treat player cells (value > 0) as live for rule application
+        is_live = np.not_equal(grid, INTERNAL_DEAD, out=self._live_mask)
+        next_alive = _next_alive_words(is_live)
+        should_be_alive = _unpack_rows(next_alive, self.width)
+        # Population straight from the packed words, without halo/padding bits
+        self._live_count = _popcount(next_alive & self._column_bits)
+
+        if not self.players:
+            # Player cells only exist for registered players, so without any every
+            # cell alive next generation is a standard live cell
+            np.multiply(should_be_alive, INTERNAL_LIVE, out=out)
+            return
+
+        influenced_cells, influencing_pids = _single_player_influence(grid, self._neighbor_rows, self._neighbor_cols)
+
+        # Survivors keep their state (standard or player), births become standard
+        # live cells, then a single influencing player claims the cell
+        np.copyto(out, grid)
+        np.copyto(out, INTERNAL_LIVE, where=np.logical_not(is_live, out=self._mask_buf))
+        out.reshape(-1)[influenced_cells] = influencing_pids
+        np.copyto(out, INTERNAL_DEAD, where=np.logical_not(should_be_alive, out=self._mask_buf))
 
     def next_generation(self):
         """Calculates the next state of the grid based on modified Conway's rules with player influence."""
-        new_grid = [[self.grid[r][c] for c in range(self.width)] for r in range(self.height)]
-
         # Track current leader before generation
         current_leader = None
         max_cells = 0
@@ -200,50 +569,22 @@ class GameOfLife:
                 max_cells = cell_count
                 current_leader = pid
 
-        for r in range(self.height):
-            for c in range(self.width):
-                current_state = self.grid[r][c]
-                live_neighbors_count, neighbor_player_ids = self._get_neighbors_state(r, c)
-                # Determine next state based purely on Conway rules
-                # Treat player cells (value > 0) as live for rule application
-                should_be_alive = False
-                is_currently_live = (current_state == INTERNAL_LIVE or current_state > 0)
-                
-                if is_currently_live:
-                    # Standard live cell survival
-                    if 2 <= live_neighbors_count <= 3:
-                        should_be_alive = True
-                else: # Currently INTERNAL_DEAD
-                    # Birth rule
-                    if live_neighbors_count == 3:
-                        should_be_alive = True
-
-                # Apply the state change or influence
-                if should_be_alive:
-                    # Check for single player influence
-                    if len(neighbor_player_ids) == 1 and live_neighbors_count > 0:
-                        influencing_pid = list(neighbor_player_ids)[0]
-                        # Check if the influencing player is different from the current cell owner (if any)
-                        # This prevents a player cell from being influenced *by itself* into INTERNAL_LIVE
-                        if influencing_pid != current_state: 
-                           new_grid[r][c] = influencing_pid # Cell becomes player-controlled
-                        # Check added for clarity: a surviving player cell not influenced stays as its ID
-                        elif current_state > 0 and influencing_pid != current_state:
-                            # This case should be rare/impossible if influence logic is correct
-                            # but ensures a player cell doesn't turn into INTERNAL_LIVE
-                            # if it survives but isn't influenced by someone else.
-                            pass # Remains its current player ID (already in new_grid)
-                    else:
-                        # Becomes/remains standard live cell if no single influence
-                        # or if it's a player cell with mixed/no player neighbors
-                        # Important: Preserve existing player cell if it wasn't overwritten by influence
-                        if not is_currently_live:
-                             new_grid[r][c] = INTERNAL_LIVE
-                else:
-                    # Cell should be dead
-                    new_grid[r][c] = INTERNAL_DEAD
-
-        self.grid = new_grid
+        if self._cycling:
+            # Generation t+1 equals t-1, which _previous still holds
+            self.grid, self._previous = self._previous, self.grid
+            self._live_count, self._previous_live_count = self._previous_live_count, self._live_count
+            self._player_counts, self._previous_player_counts = self._previous_player_counts, self._player_counts
+        else:
+            # Write the next generation into the back buffer, then rotate buffers
+            self._previous_live_count = self._live_count
+            self._previous_player_counts, self._player_counts = self._player_counts, None
+            self._step(self.grid, self._scratch)
+            self._clean_steps += 1
+            # grid(t+1) == grid(t-1) with no edit in between: the board is still or
+            # a period-2 oscillator, and every later generation is already known
+            if self._clean_steps >= 2 and np.array_equal(self._scratch, self._previous):
+                self._cycling = True
+            self.grid, self._previous, self._scratch = self._scratch, self.grid, self._previous
         self.generation_count += 1
 
         # Update generations in lead for current leader
@@ -284,37 +625,31 @@ class GameOfLife:
 
     def add_player(self, player_id, inject_disruption=False):
         """Adds a player pattern, initializes their stats, and optionally injects disruption."""
-        attempts = 0
-        max_attempts = (self.width * self.height) // (PATTERN_WIDTH * PATTERN_HEIGHT)
-        max_attempts = max(100, max_attempts) # Ensure reasonable attempts
+        if not 0 < player_id <= MAX_PLAYER_ID:
+            print(f"WARN: Player ID {player_id} does not fit in the grid (1..{MAX_PLAYER_ID}).")
+            return False
         placed_at = None
 
-        while attempts < max_attempts and placed_at is None:
-            # Choose a random top-left corner for the pattern
-            # Ensure pattern fits within bounds (subtract pattern dims)
-            start_r = random.randint(0, self.height - PATTERN_HEIGHT)
-            start_c = random.randint(0, self.width - PATTERN_WIDTH)
-
-            # Check if the area is clear
-            # Uses PLAYER_SPAWN_PATTERN (now glider)
-            can_place = self._is_area_clear(start_r, start_c, PLAYER_SPAWN_PATTERN)
-            
-            if can_place:
-                # Place the pattern using player_id
-                # Uses PLAYER_SPAWN_PATTERN (now glider)
-                self._place_pattern(start_r, start_c, PLAYER_SPAWN_PATTERN, player_id)
-                # Initialize player stats
-                current_time = asyncio.get_event_loop().time() if asyncio.get_running_loop() else time.time() # Use time if no loop
-                self.players[player_id] = {
-                     'pos': (start_r, start_c), 
-                     'last_respawn_time': current_time - RESPAWN_COOLDOWN, # Allow immediate respawn first time
-                     'respawn_count': 0,
-                     'wins': 0  # Initialize win counter
-                }
-                placed_at = (start_r, start_c)
-                # print(f"DEBUG: Added player {player_id} pattern at {placed_at}")
-
-            attempts += 1
+        # Find every top-left corner (pattern within bounds) whose footprint is clear
+        # in one pass, then pick one at random instead of retrying random corners
+        # Uses PLAYER_SPAWN_PATTERN (now glider)
+        clear_corners = self._clear_corners(PLAYER_SPAWN_PATTERN, PATTERN_HEIGHT, PATTERN_WIDTH)
+        candidates = np.flatnonzero(clear_corners)
+
+        if candidates.size:
+            start_r, start_c = divmod(int(random.choice(candidates)), clear_corners.shape[1])
+            # Place the pattern using player_id
+            self._place_pattern(start_r, start_c, PLAYER_SPAWN_PATTERN, player_id)
+            # Initialize player stats
+            current_time = _monotonic()
+            self.players[player_id] = {
+                 'pos': (start_r, start_c), 
+                 'last_respawn_time': current_time - RESPAWN_COOLDOWN, # Allow immediate respawn first time
+                 'respawn_count': 0,
+                 'wins': 0  # Initialize win counter
+            }
+            placed_at = (start_r, start_c)
+            # print(f"DEBUG: Added player {player_id} pattern at {placed_at}")
 
         if placed_at:
             # --- Inject Disruption if Requested ---
@@ -332,18 +667,14 @@ class GameOfLife:
                      offset_c = random.randint(-disruption_radius, disruption_radius)
                      # Simple check to avoid placing directly on the glider spawn footprint
                      # (This check is approximate, might still overlap glider path)
-                     is_on_pattern = False
-                     for dr, dc in PLAYER_SPAWN_PATTERN:
-                         if offset_r == dr and offset_c == dc:
-                             is_on_pattern = True
-                             break
-                     if is_on_pattern:
+                     if (offset_r, offset_c) in _SPAWN_OFFSET_SET:
                          disrupt_attempts += 1
                          continue
 
                      r, c = (start_r + offset_r) % self.height, (start_c + offset_c) % self.width
-                     if self._is_valid(r, c) and self.grid[r][c] == INTERNAL_DEAD:
-                         self.grid[r][c] = INTERNAL_LIVE
+                     if self.grid[r, c] == INTERNAL_DEAD:
+                         self.grid[r, c] = INTERNAL_LIVE
+                         self._grid_edited()
                          disrupted_count += 1
                          # print(f"DEBUG: Added disruption cell at ({r}, {c})")
                      disrupt_attempts += 1
@@ -352,9 +683,18 @@ class GameOfLife:
             # --- End Disruption Injection ---
             return True # Successfully placed player
         else:
-             print(f"WARN: Could not find empty spot for player {player_id} pattern after {max_attempts} attempts.")
+             print(f"WARN: Could not find empty spot for player {player_id} pattern.")
              return False # Failed to add player
 
+    def _clear_player_cells(self, player_id):
+        """Kills every cell owned by player_id in one masked write; returns how many."""
+        player_cells = self.grid == player_id
+        removed_count = int(np.count_nonzero(player_cells))
+        if removed_count:
+            self.grid[player_cells] = INTERNAL_DEAD
+            self._grid_edited()
+        return removed_count
+
     def remove_player(self, player_id):
         """Removes a player pattern and their data from the grid."""
         if player_id in self.players:
@@ -367,12 +707,7 @@ class GameOfLife:
             #      print(f"WARN: Player {player_id} data missing position during removal.")
 
             # Clear ALL cells owned by this player_id across the grid
-            removed_count = 0
-            for r in range(self.height):
-                for c in range(self.width):
-                    if self.grid[r][c] == player_id:
-                        self.grid[r][c] = INTERNAL_DEAD
-                        removed_count += 1
+            removed_count = self._clear_player_cells(player_id)
             
             # if removed_count > 0:
             #    print(f"DEBUG: Cleared {removed_count} cells for player {player_id}.")
@@ -381,6 +716,7 @@ class GameOfLife:
 
             # Remove player entry completely
             del self.players[player_id]
+            self._last_views.pop(player_id, None)
             # print(f"DEBUG: Removed player {player_id} data.")
         # else: Player not found in dict, nothing to remove from grid or dict.
         #    print(f"DEBUG: remove_player called for player_id {player_id} not in self.players dict.")
@@ -399,7 +735,7 @@ class GameOfLife:
             return (False, "Player state not found. Cannot respawn.")
 
         player_data = self.players[player_id]
-        current_time = asyncio.get_event_loop().time() if asyncio.get_running_loop() else time.time()
+        current_time = _monotonic()
         last_respawn = player_data.get('last_respawn_time', 0)
         time_since_respawn = current_time - last_respawn
 
@@ -413,9 +749,8 @@ class GameOfLife:
         if is_god_mode:
             # God mode: Reset entire board
             # 1. Clear all cells
-            for r in range(self.height):
-                for c in range(self.width):
-                    self.grid[r][c] = INTERNAL_DEAD
+            self.grid.fill(INTERNAL_DEAD)
+            self._grid_edited()
             
             # 2. Reset generation count
             self.generation_count = 0
@@ -465,43 +800,21 @@ class GameOfLife:
                 return (False, "Respawn failed: No position data found")
 
             # 2. Remove only the player's cells
-            removed_count = 0
-            for r in range(self.height):
-                for c in range(self.width):
-                    if self.grid[r][c] == player_id:
-                        self.grid[r][c] = INTERNAL_DEAD
-                        removed_count += 1
-
-            # 3. Try to respawn near the current position
-            # Start with a small offset and gradually increase if needed
-            max_offset = 5  # Maximum distance to try from current position
-            success = False
+            removed_count = self._clear_player_cells(player_id)
+
+            # 3. Try to respawn near the current position, nearest shell first.
+            # The footprint of every candidate is checked in one gather
+            starts_r = (current_pos[0] + RESPAWN_OFFSETS[:, 0]) % self.height
+            starts_c = (current_pos[1] + RESPAWN_OFFSETS[:, 1]) % self.width
+            rows = (starts_r[:, None] + PLAYER_SPAWN_PATTERN[:, 0]) % self.height
+            cols = (starts_c[:, None] + PLAYER_SPAWN_PATTERN[:, 1]) % self.width
+            clear = np.flatnonzero(~np.any(self.grid[rows, cols] != INTERNAL_DEAD, axis=1))
+            success = clear.size > 0
             new_pos = None
 
-            for offset in range(1, max_offset + 1):
-                # Try different directions around the current position
-                for dr in [-offset, 0, offset]:
-                    for dc in [-offset, 0, offset]:
-                        if dr == 0 and dc == 0:
-                            continue  # Skip current position
-                        
-                        # Calculate new position with wrapping
-                        new_r = (current_pos[0] + dr) % self.height
-                        new_c = (current_pos[1] + dc) % self.width
-                        
-                        # Check if we can place the pattern here
-                        if self._is_area_clear(new_r, new_c, PLAYER_SPAWN_PATTERN):
-                            # Place the pattern
-                            self._place_pattern(new_r, new_c, PLAYER_SPAWN_PATTERN, player_id)
-                            new_pos = (new_r, new_c)
-                            success = True
-                            break
-                    if success:
-                        break
-                if success:
-                    break
-
             if success:
+                new_pos = (int(starts_r[clear[0]]), int(starts_c[clear[0]]))
+                self._place_pattern(new_pos[0], new_pos[1], PLAYER_SPAWN_PATTERN, player_id)
                 # 4. Update player stats
                 self.players[player_id]['last_respawn_time'] = current_time
                 self.players[player_id]['respawn_count'] = old_respawn_count + 1
@@ -517,21 +830,82 @@ class GameOfLife:
 
     def get_live_cell_count(self):
         """Counts the total number of live cells (standard and player-owned)."""
-        count = 0
-        for r in range(self.height):
-            for c in range(self.width):
-                if self.grid[r][c] != INTERNAL_DEAD:
-                    count += 1
-        return count
+        if self._live_count is None:
+            self._live_count = int(np.count_nonzero(self.grid != INTERNAL_DEAD))
+        return self._live_count
 
     def get_player_cell_count(self, player_id):
         """Counts the number of cells owned by a specific player."""
-        count = 0
-        for r in range(self.height):
-            for c in range(self.width):
-                if self.grid[r][c] == player_id:
-                    count += 1
-        return count
+        if self._player_counts is None:
+            # One pass tallies every player; the leader check and each client's
+            # leaderboard then read it instead of rescanning the grid per player
+            grid = self.grid
+            self._player_counts = np.bincount(grid[grid > 0])
+        counts = self._player_counts
+        return int(counts[player_id]) if 0 < player_id < counts.size else 0
+
+    def _get_view_size(self):
+        """Returns the (width, height) of the viewport, cached until invalidate_view_size()."""
+        if self._view_size is None:
+            # Get terminal size for responsive viewport
+            try:
+                term_cols, term_rows = os.get_terminal_size()
+                # Use 80% of terminal width and 50% of terminal height
+                view_width = int(term_cols * 0.8)
+                view_height = int(term_rows * 0.5)
+                # Ensure minimum size
+                view_width = max(60, view_width)
+                view_height = max(30, view_height)
+            except OSError:
+                # Fallback to default sizes if terminal size detection fails
+                view_width = 80
+                view_height = 40
+            self._view_size = (view_width, view_height)
+        return self._view_size
+
+    def invalidate_view_size(self):
+        """Forces the terminal size to be re-read on the next render (call on SIGWINCH)."""
+        self._view_size = None
+        self._view_index_cache.clear()
+
+    def _get_frame_buffer(self, view_height, view_width):
+        """Returns the reusable (height, width + line end) code point buffer for the viewport.
+
+        Line end code points are written once when the buffer is (re)allocated; each
+        frame only overwrites the cell columns.
+        """
+        shape = (view_height, view_width + len(VIEW_LINE_END_CODEPOINTS))
+        if self._frame_buffer is None or self._frame_buffer.shape != shape:
+            self._frame_buffer = np.empty(shape, dtype='<u4')
+            self._frame_buffer[:, view_width:] = VIEW_LINE_END_CODEPOINTS
+        return self._frame_buffer
+
+    def _get_view_index(self, start_r, start_c, view_height, view_width):
+        """Returns the np.ix_ index of a wrapped viewport, memoized per origin and size."""
+        key = (start_r, start_c, view_height, view_width)
+        view_index = self._view_index_cache.get(key)
+        if view_index is None:
+            if len(self._view_index_cache) >= VIEW_INDEX_CACHE_SIZE:
+                self._view_index_cache.clear()
+            rows = (start_r + np.arange(view_height)) % self.height
+            cols = (start_c + np.arange(view_width)) % self.width
+            view_index = self._view_index_cache[key] = np.ix_(rows, cols)
+        return view_index
+
+    def _view_patch(self, cells, previous, viewport, view_width):
+        """Returns cursor-addressed writes of the viewport cells that differ from `previous`.
+
+        Each changed row is rewritten from its first to its last changed column,
+        sliced out of the already decoded `viewport` text.
+        """
+        changed = cells != previous
+        rows = np.flatnonzero(changed.any(axis=1))
+        changed = changed[rows]
+        first = changed.argmax(axis=1)
+        end = view_width - changed[:, ::-1].argmax(axis=1)
+        stride = view_width + len(RENDER_LINE_END)
+        return ''.join([f"\033[{r + 1};{c0 + 1}H{viewport[r * stride + c0:r * stride + c1]}"
+                        for r, c0, c1 in zip(rows.tolist(), first.tolist(), end.tolist())])
 
     def get_render_string(self, requesting_player_id, player_state):
         """Generates the game board render string with player-specific view."""
@@ -540,22 +914,11 @@ class GameOfLife:
         if not player_pos:
             return "Error: Player not found in game state."
 
-        # Get terminal size for responsive viewport
-        try:
-            term_cols, term_rows = os.get_terminal_size()
-            # Use 80% of terminal width and 50% of terminal height
-            view_width = int(term_cols * 0.8)
-            view_height = int(term_rows * 0.5)
-            # Ensure minimum size
-            view_width = max(60, view_width)
-            view_height = max(30, view_height)
-        except OSError:
-            # Fallback to default sizes if terminal size detection fails
-            view_width = 80
-            view_height = 40
-
-        # Start with basic screen clear and cursor handling
-        render_output = CLEAR_SCREEN + HIDE_CURSOR
+        view_width, view_height = self._get_view_size()
+
+        # Repaint in place from the top-left instead of clearing the whole screen
+        # every frame (avoids flicker); stale text is cleared per line below
+        render_output = CURSOR_HOME + HIDE_CURSOR
 
         center_r, center_c = player_pos
 
@@ -563,48 +926,37 @@ class GameOfLife:
         start_r = (center_r - view_height // 2) % self.height
         start_c = (center_c - view_width // 2) % self.width
 
-        # Build the viewport with pre-allocated list for better performance
-        viewport = [''] * view_height
-        for i in range(view_height):
-            row = [''] * view_width
-            for j in range(view_width):
-                # Calculate actual grid position with wrapping
-                r = (start_r + i) % self.height
-                c = (start_c + j) % self.width
-                cell = self.grid[r][c]
-                
-                # Determine what to display
-                if cell == INTERNAL_DEAD:
-                    row[j] = RENDER_DEAD
-                elif cell == INTERNAL_LIVE:
-                    row[j] = RENDER_LIVE
-                elif cell == requesting_player_id:
-                    row[j] = RENDER_PLAYER
-                else:
-                    row[j] = RENDER_OTHER_PLAYER
-            viewport[i] = ''.join(row)
+        # Extract the wrapped viewport and write each cell's glyph code point
+        view = self.grid[self._get_view_index(start_r, start_c, view_height, view_width)]
+        frame = self._get_frame_buffer(view_height, view_width)
+        cells = frame[:, :view_width]
+        cells[...] = VIEW_CODEPOINT_OTHER
+        cells[view == requesting_player_id] = VIEW_CODEPOINT_PLAYER
+        cells[view == INTERNAL_LIVE] = VIEW_CODEPOINT_LIVE
+        cells[view == INTERNAL_DEAD] = VIEW_CODEPOINT_DEAD
+        # The trailing line end is dropped since the status text starts with one
+        viewport = frame.reshape(-1)[:-len(VIEW_LINE_END_CODEPOINTS)].tobytes().decode('utf-32-le')
 
         # Build the status line
         player_data = self.players.get(requesting_player_id, {})
         respawn_count = player_data.get('respawn_count', 0)
         wins = player_data.get('wins', 0)
         last_respawn = player_data.get('last_respawn_time', 0)
-        current_time = asyncio.get_event_loop().time() if asyncio.get_running_loop() else time.time()
+        current_time = _monotonic()
         cooldown_remaining = max(0, RESPAWN_COOLDOWN - (current_time - last_respawn))
         
-        # Pre-build all sections for better performance
-        overview = f"\n{COLOR_BOLD}Game of Life - Multiplayer Edition{COLOR_RESET}"
-        overview += f"\nActive Players: {len(self.players)} | Current Generation: {self.generation_count}/2500"
-        overview += f"\nYour Wins: {wins} | Respawns: {respawn_count} | Cooldown: {cooldown_remaining:.1f}s"
-        overview += "\n"
-        
-        legend = f"\nLegend: {RENDER_DEAD}=Empty {RENDER_LIVE}=Live {RENDER_PLAYER}=You {RENDER_OTHER_PLAYER}=Other"
-        
+        # Collect every section as fragments and join once at the end; the first
+        # two (cursor setup and viewport) are filled in once the frame height is known
+        parts = [render_output, viewport, STATUS_TITLE,
+                 f"{RENDER_LINE_END}Active Players: {len(self.players)} | Current Generation: {self.generation_count}/2500",
+                 f"{RENDER_LINE_END}Your Wins: {wins} | Respawns: {respawn_count} | Cooldown: {cooldown_remaining:.1f}s",
+                 RENDER_LINE_END, STATUS_LEGEND]
+
         # Add key instructions
-        key_instructions = "\nKeys: r=respawn | q=quit"
         if player_state.get('debug_mode') or player_state.get('god_mode'):
-            key_instructions += " | h=hot reload"
-        key_instructions += "\n"
+            parts.append(STATUS_KEYS_DEBUG)
+        else:
+            parts.append(STATUS_KEYS)
 
         # Generate leaderboard
         player_scores = []
@@ -616,7 +968,7 @@ class GameOfLife:
         player_scores.sort(key=lambda x: x[1], reverse=True)
         top_3 = player_scores[:3]
         
-        leaderboard = "\nTop 3 Players:"
+        parts.append(STATUS_LEADERBOARD_TITLE)
         all_time_leader = max(self.players.items(), key=lambda x: x[1].get('generations_in_lead', 0))[0] if self.players else None
         
         for i in range(1, 4):
@@ -633,8 +985,9 @@ class GameOfLife:
                     row = f"{COLOR_BOLD}{COLOR_PLAYER}{row}{COLOR_RESET}"
             else:
                 row = f"{i}. Waiting for players..."
-            leaderboard += f"\n{row}"
-        leaderboard += "\n"
+            parts.append(RENDER_LINE_END)
+            parts.append(row)
+        parts.append(RENDER_LINE_END)
 
         # Build messages section
         messages = []
@@ -642,10 +995,48 @@ class GameOfLife:
             messages.append(player_state['confirmation_prompt'])
         if player_state.get('feedback_message'):
             messages.append(player_state['feedback_message'])
-        command_prompt = "\nEnter command: "
 
-        # Combine everything with proper spacing and restore cursor
-        return render_output + '\n'.join(viewport) + overview + legend + key_instructions + leaderboard + '\n'.join(messages) + command_prompt + SHOW_CURSOR
+        # Combine everything with proper spacing and restore cursor. Each line ends
+        # with CLEAR_LINE so shorter text doesn't leave residue of the last frame;
+        # only the free-form messages still need their newlines translated
+        parts.append('\n'.join(messages).replace('\n', RENDER_LINE_END))
+        parts.append(STATUS_COMMAND_PROMPT)
+
+        # A client whose terminal (reported by the server as 'term_size') holds the
+        # whole frame without wrapping or scrolling still shows the previous frame,
+        # so only the viewport cells that changed since then are sent. Every status
+        # line is measured by its visible width, since a wrapped line would scroll
+        # the screen and misplace all later cursor-addressed patches
+        term_cols, term_rows = player_state.get('term_size', (0, 0))
+        fits = False
+        if view_width < term_cols:
+            status_lines = _ANSI_ESCAPE.sub('', ''.join(parts[2:])).split('\n')
+            fits = (view_height + len(status_lines) - 1 <= term_rows
+                    and max(map(len, status_lines)) < term_cols)
+        if fits:
+            last_view = self._last_views.get(requesting_player_id)
+            if (last_view is not None and last_view[0] == (term_cols, term_rows)
+                    and last_view[2].shape == cells.shape):
+                _, frames_since_full, previous = last_view
+                if frames_since_full < RENDER_FULL_FRAME_INTERVAL:
+                    parts[0] = HIDE_CURSOR
+                    # Leave the cursor where the full viewport would have: after the last row
+                    parts[1] = (self._view_patch(cells, previous, viewport, view_width)
+                                + f"\033[{view_height};{view_width + 1}H")
+                    frames_since_full += 1
+                else:
+                    frames_since_full = 0
+                # The stored copy is overwritten in place rather than reallocated
+                np.copyto(previous, cells)
+            else:
+                frames_since_full, previous = 0, cells.copy()
+            self._last_views[requesting_player_id] = ((term_cols, term_rows), frames_since_full, previous)
+        else:
+            self._last_views.pop(requesting_player_id, None)
+
+        parts.append(CLEAR_TO_END)
+        parts.append(SHOW_CURSOR)
+        return ''.join(parts)
 
 # Example usage (only if run directly)
 if __name__ == "__main__":
@@ -660,30 +1051,41 @@ if __name__ == "__main__":
          pass 
 
     game = GameOfLife(width=cols, height=rows)
+    signal.signal(signal.SIGWINCH, lambda signum, frame: game.invalidate_view_size())
     game.add_player(1)
     game.add_player(99)
 
     player_1_state = {
          'confirmation_prompt': None, 
          'feedback_message': "Test Feedback!", 
-         'feedback_expiry_time': time.time() + 5.0 
+         'feedback_expiry_time': _monotonic() + 5.0 
          } 
 
+    # Frames go out through one block-buffered writer and a single flush per frame
+    frame_out = open(sys.stdout.fileno(), 'wb', buffering=1 << 16, closefd=False)
+
     try:
         # Set terminal to raw mode
         tty.setraw(sys.stdin.fileno())
         
+        # Pace frames against fixed deadlines so render time doesn't stretch the period
+        frame_deadline = time.monotonic()
         while True:
-            current_time_test = time.time()
+            current_time_test = _monotonic()
             if player_1_state.get('feedback_message') and current_time_test >= player_1_state.get('feedback_expiry_time', 0.0):
                  player_1_state['feedback_message'] = None
                  player_1_state['feedback_expiry_time'] = 0.0
             
             render_output = game.get_render_string(requesting_player_id=1, player_state=player_1_state) 
-            sys.stdout.write(render_output)
-            sys.stdout.flush()
+            frame_out.write(render_output.encode('utf-8', 'replace'))
+            frame_out.flush()
             game.next_generation()
-            time.sleep(0.1)
+            frame_deadline += 0.1
+            now = time.monotonic()
+            if now < frame_deadline:
+                time.sleep(frame_deadline - now)
+            else:
+                frame_deadline = now
 
     except KeyboardInterrupt:
         print("\nExiting.")
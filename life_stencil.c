@@ -0,0 +1,90 @@
+/*
+ * Generation step for GameOfLife, loaded through ctypes when present.
+ *
+ * Build (from the repo root):
+ *     cc -O3 -march=native -fopenmp -shared -fPIC -o life_stencil.so life_stencil.c
+ *
+ * Same rules as the NumPy and Numba paths in game_of_life.py: grid cells are
+ * int16 (GRID_DTYPE) holding INTERNAL_DEAD (0), INTERNAL_LIVE (-1) or a player
+ * ID (> 0). A cell that is alive in the next generation is claimed by a player
+ * when that player is the only one among its live neighbors.
+ *
+ * Returns the number of live cells in the generation written to `out`.
+ */
+#include <stddef.h>
+#include <stdint.h>
+
+#define INTERNAL_DEAD 0
+#define INTERNAL_LIVE (-1)
+
+/* Checked by the loader, so a library built for another cell type is ignored */
+const int life_cell_size = sizeof(int16_t);
+
+static inline void tally(int16_t state, int *live_count, int16_t *first_pid, int *mixed)
+{
+    if (state != INTERNAL_DEAD) {
+        (*live_count)++;
+        if (state > 0) {
+            if (*first_pid == 0)
+                *first_pid = state;
+            else if (state != *first_pid)
+                *mixed = 1;
+        }
+    }
+}
+
+static inline int16_t next_state(const int16_t *up, const int16_t *row, const int16_t *down,
+                                 int c, int left, int right)
+{
+    int live_count = 0, mixed = 0;
+    int16_t first_pid = 0;
+
+    tally(up[left], &live_count, &first_pid, &mixed);
+    tally(up[c], &live_count, &first_pid, &mixed);
+    tally(up[right], &live_count, &first_pid, &mixed);
+    tally(row[left], &live_count, &first_pid, &mixed);
+    tally(row[right], &live_count, &first_pid, &mixed);
+    tally(down[left], &live_count, &first_pid, &mixed);
+    tally(down[c], &live_count, &first_pid, &mixed);
+    tally(down[right], &live_count, &first_pid, &mixed);
+
+    int16_t current = row[c];
+    int alive = current != INTERNAL_DEAD ? (live_count == 2 || live_count == 3)
+                                         : live_count == 3;
+    if (!alive)
+        return INTERNAL_DEAD;
+    if (first_pid != 0 && !mixed)
+        return first_pid; /* Single player influence claims the cell */
+    if (current != INTERNAL_DEAD)
+        return current; /* Survivor keeps its state */
+    return INTERNAL_LIVE; /* Standard birth */
+}
+
+long long life_step(const int16_t *in, int16_t *out, int width, int height)
+{
+    long long total_live = 0;
+    int r;
+#pragma omp parallel for schedule(static) reduction(+:total_live)
+    for (r = 0; r < height; r++) {
+        const int16_t *up = in + (size_t)(r == 0 ? height - 1 : r - 1) * width;
+        const int16_t *row = in + (size_t)r * width;
+        const int16_t *down = in + (size_t)(r == height - 1 ? 0 : r + 1) * width;
+        int16_t *dst = out + (size_t)r * width;
+        long long row_live = 0;
+
+        /* Interior columns need no wrap, so the loop body has no index selects;
+         * the first and last column wrap explicitly */
+        for (int c = 1; c < width - 1; c++) {
+            dst[c] = next_state(up, row, down, c, c - 1, c + 1);
+            row_live += dst[c] != INTERNAL_DEAD;
+        }
+        dst[0] = next_state(up, row, down, 0, width - 1, width > 1 ? 1 : 0);
+        row_live += dst[0] != INTERNAL_DEAD;
+        if (width > 1) {
+            dst[width - 1] = next_state(up, row, down, width - 1, width - 2, 0);
+            row_live += dst[width - 1] != INTERNAL_DEAD;
+        }
+        total_live += row_live;
+    }
+    return total_live;
+}
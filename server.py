@@ -14,13 +14,14 @@ from watchdog.events import FileSystemEventHandler
 from pathlib import Path
 
 # Import the GameOfLife class and the constant
-from game_of_life import GameOfLife, RESPAWN_COOLDOWN
+from game_of_life import GameOfLife, RESPAWN_COOLDOWN, MAX_PLAYER_ID
 from god_mode_config import GOD_MODE_PASSWORD
 
 # --- Configuration ---
 SERVER_HOST = '0.0.0.0' # Listen on all interfaces
 SERVER_PORT = 8022      # Port for SSH connections (make sure it's not used)
 GAME_TICK_RATE = 0.1    # Seconds between game generations
+RENDER_TICK_RATE = 0.1  # Minimum seconds between frames sent to clients
 SERVER_KEYS = ['ssh_host_key'] # Path to server's private key
 LOG_LEVEL = logging.INFO
 GOD_MODE_KEY = 'g' # Key to enter god mode
@@ -43,6 +44,8 @@ clients = {} # player_id -> {'chan': SSH Channel, 'state': {'confirmation_prompt
 # pending_connections = {} # REMOVED
 next_player_id = 1 # Start player IDs from 1
 game_loop_task: asyncio.Task | None = None
+render_loop_task: asyncio.Task | None = None
+frame_ready_event = asyncio.Event()  # Set after each generation, consumed by the render loop
 shutdown_event = asyncio.Event()
 clean_shutdown_requested = False # NEW Global flag
 code_reload_event = asyncio.Event()  # New event for code reload
@@ -59,26 +62,36 @@ last_live_counts = []
 is_board_stable = False
 # --- End Stability Tracking ---
 
+def allocate_player_id():
+    """Returns the next sequential player ID, wrapping at MAX_PLAYER_ID (the largest
+    value a grid cell holds) and skipping IDs that are still in use."""
+    global next_player_id
+    for _ in range(MAX_PLAYER_ID):
+        player_id = next_player_id
+        next_player_id = player_id % MAX_PLAYER_ID + 1
+        if player_id not in clients and not (game and player_id in game.players):
+            break
+    return player_id
+
 async def run_game_loop():
     """Task to run the game simulation and check for stability."""
     global game, is_board_stable, last_live_counts
     log.info("Starting game loop...")
     loop_count = 0 # Debug counter
-    clear_screen_code = "\x1b[2J\x1b[H"
     
     # Wait for game to be initialized
     while not game:
         log.info("Waiting for game to be initialized...")
         await asyncio.sleep(0.5)
     
+    # Ticks are scheduled against fixed deadlines so sleep overshoot doesn't accumulate
+    next_tick_deadline = time.monotonic()
     while not shutdown_event.is_set():
         if game:
             loop_count += 1
             if loop_count % 10 == 0: # Log every 10 ticks
                 log.debug(f"Game loop tick #{loop_count} - Stable: {is_board_stable} - Clients: {list(clients.keys())}")
 
-            start_time = asyncio.get_event_loop().time()
-
             # --- Update Game State ---
             previous_live_count = game.get_live_cell_count() if last_live_counts else 0
             game.next_generation()
@@ -104,58 +117,19 @@ async def run_game_loop():
                          is_board_stable = True
             # --- End Stability Check ---
 
-            # --- Send Updates to Clients ---
-            disconnected_players = []
-            current_time = asyncio.get_event_loop().time() # Get time once per tick
-            
-            for player_id, client_data in list(clients.items()): 
-                chan = client_data['chan']
-                player_state = client_data['state']
-                try:
-                    # --- Check/Clear Expired Feedback --- 
-                    if player_state.get('feedback_message') and current_time >= player_state.get('feedback_expiry_time', 0.0):
-                         # log.debug(f"Clearing expired feedback for player {player_id}") # Optional debug
-                         player_state['feedback_message'] = None
-                         player_state['feedback_expiry_time'] = 0.0
-                    # --- End Feedback Check ---
-                    
-                    # Generate personalized render string, passing player state
-                    # current_prompt = player_state.get('confirmation_prompt') # No longer needed here
-                    render_str = game.get_render_string(player_id, player_state=player_state)
-                    
-                    # Logging (FIXED newline formatting)
-                    if loop_count % 10 == 1: 
-                        # Log state details for debugging
-                        log.debug(f"Render state for player {player_id}: {player_state}")
-                        # log.debug(f"Render string for player {player_id} (prompt='{current_prompt}'): {render_str[:80].replace('\n', '\\n')}...")
-
-                    # Send game state WITH screen clear
-                    chan.write(clear_screen_code + render_str) 
-
-                except (asyncssh.misc.ConnectionLost, BrokenPipeError, OSError) as exc:
-                    log.warning(f"Player {player_id} connection lost during update: {exc}")
-                    disconnected_players.append(player_id)
-                except Exception as exc:
-                     log.error(f"Error sending update to player {player_id}: {exc}", exc_info=True)
-                     disconnected_players.append(player_id) # Assume connection is broken
-
-            # Remove clients that disconnected during the update phase
-            for player_id in disconnected_players:
-                if player_id in clients:
-                    log.info(f"Removing player {player_id} from clients due to update error.")
-                    # Channel is likely already closed, but try closing just in case
-                    try:
-                         if not clients[player_id]['chan'].is_closing():
-                              clients[player_id]['chan'].close()
-                    except Exception:
-                         pass # Ignore errors during cleanup
-                    del clients[player_id]
-                    # Game state removal is handled in session connection_lost
+            # Hand the new generation to the render loop (intermediate frames are
+            # dropped if rendering falls behind)
+            frame_ready_event.set()
 
             # --- Maintain Tick Rate ---
-            elapsed_time = asyncio.get_event_loop().time() - start_time
-            sleep_duration = max(0, GAME_TICK_RATE - elapsed_time)
-            await asyncio.sleep(sleep_duration)
+            next_tick_deadline += GAME_TICK_RATE
+            now = time.monotonic()
+            if now < next_tick_deadline:
+                await asyncio.sleep(next_tick_deadline - now)
+            else:
+                # Running behind: restart the schedule instead of bursting to catch up
+                next_tick_deadline = now
+                await asyncio.sleep(0)
 
         else:
             # Wait if game not initialized yet
@@ -163,6 +137,74 @@ async def run_game_loop():
     log.info("Game loop stopped.")
 
 
+async def run_render_loop():
+    """Task to send the latest game state to clients, decoupled from the simulation."""
+    log.info("Starting render loop...")
+    render_count = 0 # Debug counter
+
+    while not shutdown_event.is_set():
+        # Wait for a new generation; only the latest one is rendered
+        await frame_ready_event.wait()
+        frame_ready_event.clear()
+        if not game:
+            continue
+        render_count += 1
+        start_time = time.monotonic()
+
+        # --- Send Updates to Clients ---
+        disconnected_players = []
+        current_time = time.monotonic() # Get time once per tick
+        
+        for player_id, client_data in list(clients.items()): 
+            chan = client_data['chan']
+            player_state = client_data['state']
+            try:
+                # --- Check/Clear Expired Feedback --- 
+                if player_state.get('feedback_message') and current_time >= player_state.get('feedback_expiry_time', 0.0):
+                     # log.debug(f"Clearing expired feedback for player {player_id}") # Optional debug
+                     player_state['feedback_message'] = None
+                     player_state['feedback_expiry_time'] = 0.0
+                # --- End Feedback Check ---
+                
+                # Generate personalized render string, passing player state
+                # current_prompt = player_state.get('confirmation_prompt') # No longer needed here
+                render_str = game.get_render_string(player_id, player_state=player_state)
+                
+                # Logging (FIXED newline formatting)
+                if render_count % 10 == 1: 
+                    # Log state details for debugging
+                    log.debug(f"Render state for player {player_id}: {player_state}")
+                    # log.debug(f"Render string for player {player_id} (prompt='{current_prompt}'): {render_str[:80].replace('\n', '\\n')}...")
+
+                # Send game state (the render string repaints from the top itself)
+                chan.write(render_str) 
+
+            except (asyncssh.misc.ConnectionLost, BrokenPipeError, OSError) as exc:
+                log.warning(f"Player {player_id} connection lost during update: {exc}")
+                disconnected_players.append(player_id)
+            except Exception as exc:
+                 log.error(f"Error sending update to player {player_id}: {exc}", exc_info=True)
+                 disconnected_players.append(player_id) # Assume connection is broken
+
+        # Remove clients that disconnected during the update phase
+        for player_id in disconnected_players:
+            if player_id in clients:
+                log.info(f"Removing player {player_id} from clients due to update error.")
+                # Channel is likely already closed, but try closing just in case
+                try:
+                     if not clients[player_id]['chan'].is_closing():
+                          clients[player_id]['chan'].close()
+                except Exception:
+                     pass # Ignore errors during cleanup
+                del clients[player_id]
+                # Game state removal is handled in session connection_lost
+
+        # --- Pace Rendering ---
+        elapsed_time = time.monotonic() - start_time
+        await asyncio.sleep(max(0, RENDER_TICK_RATE - elapsed_time))
+    log.info("Render loop stopped.")
+
+
 # --- SSH Session Class --- 
 
 class GameSSHServerSession(asyncssh.SSHServerSession):
@@ -189,16 +231,26 @@ class GameSSHServerSession(asyncssh.SSHServerSession):
                  'feedback_message': None, 
                  'feedback_expiry_time': 0.0,
                  'god_mode': False,
-                 'entering_password': False  # Track password entry state
+                 'entering_password': False,  # Track password entry state
+                 'term_size': (0, 0)  # Client (cols, rows) once a PTY is granted; lets renders send diffs
                  } 
          }
         log.debug(f"Player {self._player_id} added to active clients with state.")
 
-    def pty_requested(self, term_type, term_rows, term_cols) -> bool:
+    def pty_requested(self, term_type, term_size, term_modes) -> bool:
          """Called when the client requests a pseudo-terminal."""
+         term_cols, term_rows = term_size[:2]
          log.debug(f"Player {self._player_id}: pty_requested (TERM={term_type}, size={term_cols}x{term_rows})")
+         if self._player_id in clients:
+             clients[self._player_id]['state']['term_size'] = (term_cols, term_rows)
          return True # Accept PTY request
 
+    def terminal_size_changed(self, width, height, pixwidth, pixheight):
+         """Called when the client's terminal is resized."""
+         log.debug(f"Player {self._player_id}: terminal resized to {width}x{height}")
+         if self._player_id in clients:
+             clients[self._player_id]['state']['term_size'] = (width, height)
+
     def shell_requested(self) -> bool:
         """Called when the client requests an interactive shell."""
         log.debug(f"Player {self._player_id}: shell_requested.")
@@ -369,7 +421,7 @@ class GameSSHServerSession(asyncssh.SSHServerSession):
                         player_game_data = game.players.get(self._player_id)
                         on_cooldown = False
                         if player_game_data:
-                            current_time = asyncio.get_event_loop().time() if asyncio.get_running_loop() else time.time()
+                            current_time = time.monotonic()
                             last_respawn = player_game_data.get('last_respawn_time', 0)
                             time_since_respawn = current_time - last_respawn
                             if time_since_respawn < RESPAWN_COOLDOWN: 
@@ -387,7 +439,7 @@ class GameSSHServerSession(asyncssh.SSHServerSession):
                         # else: Cooldown check handled above (no feedback)
                     else:
                         # Set feedback state for this error case
-                        current_time = asyncio.get_event_loop().time() if asyncio.get_running_loop() else time.time()
+                        current_time = time.monotonic()
                         player_state['feedback_message'] = "Game not ready for respawn."
                         player_state['feedback_expiry_time'] = current_time + 3.0
                     action_taken = True
@@ -402,7 +454,7 @@ class GameSSHServerSession(asyncssh.SSHServerSession):
 
             # --- Update Feedback State ---
             if feedback_msg:
-                current_time = asyncio.get_event_loop().time() if asyncio.get_running_loop() else time.time()
+                current_time = time.monotonic()
                 player_state['feedback_message'] = feedback_msg
                 player_state['feedback_expiry_time'] = current_time + feedback_expiry
 
@@ -411,7 +463,7 @@ class GameSSHServerSession(asyncssh.SSHServerSession):
             # feedback_msg = "\r\nAn internal error occurred processing your request.\r\n"
             # Set feedback state for errors
             if player_state:
-                 current_time = asyncio.get_event_loop().time() if asyncio.get_running_loop() else time.time()
+                 current_time = time.monotonic()
                  player_state['feedback_message'] = "An internal error occurred processing your request."
                  player_state['feedback_expiry_time'] = current_time + 3.0
                  player_state['confirmation_prompt'] = None # Clear prompt on error too
@@ -451,8 +503,7 @@ class GameSSHServer(asyncssh.SSHServer):
         global next_player_id, game, is_board_stable, last_live_counts
         
         # Assign sequential player ID
-        self._player_id = next_player_id 
-        next_player_id += 1
+        self._player_id = allocate_player_id()
         log.info(f"Assigned player ID {self._player_id} to this connection instance from {conn.get_extra_info('peername')[0] if conn.get_extra_info('peername') else 'unknown'}")
 
         if not game:
@@ -522,13 +573,15 @@ class GameSSHServer(asyncssh.SSHServer):
 
 async def start_server():
     """Starts the SSH server and the game loop. Returns True on clean shutdown, False on error/restart needed."""
-    global game, game_loop_task, shutdown_event, clean_shutdown_requested, clients, next_player_id, last_live_counts, is_board_stable
+    global game, game_loop_task, render_loop_task, shutdown_event, clean_shutdown_requested, clients, next_player_id, last_live_counts, is_board_stable
     
     # Reset state for potential restarts
     game = None
     clients = {}
     next_player_id = 1
     game_loop_task = None
+    render_loop_task = None
+    frame_ready_event.clear()
     shutdown_event.clear() # Ensure event is clear on start/restart
     clean_shutdown_requested = False # Reset flag
     code_reload_event.clear()  # Clear the reload event
@@ -591,10 +644,12 @@ async def start_server():
     game = GameOfLife(width=game_width, height=game_height)
     log.info("Game board initialized.")
 
-    # Start the game loop task BEFORE starting the server
+    # Start the game and render loop tasks BEFORE starting the server
     log.info("Creating game loop task...")
     game_loop_task = asyncio.create_task(run_game_loop())
     game_loop_task.add_done_callback(lambda t: log.info(f"Game loop task finished: {t}"))
+    render_loop_task = asyncio.create_task(run_render_loop())
+    render_loop_task.add_done_callback(lambda t: log.info(f"Render loop task finished: {t}"))
 
     try:
         log.info(f"Starting SSH server on {SERVER_HOST}:{SERVER_PORT}...")
@@ -665,6 +720,14 @@ async def start_server():
                 log.info("Game loop task confirmed cancelled.")
             except Exception as e:
                  log.warning(f"Error awaiting cancelled game loop task: {e}")
+
+        # Cancel the render loop task (it may be waiting for a frame)
+        if render_loop_task and not render_loop_task.done():
+            render_loop_task.cancel()
+            try:
+                await render_loop_task
+            except asyncio.CancelledError:
+                log.info("Render loop task confirmed cancelled.")
         
         # Cancel the reload task
         if not reload_task.done():
@@ -690,6 +753,11 @@ def handle_signal(sig, frame):
     else:
         log.warning(f"Received signal {sig} again, shutdown already in progress.")
 
+def handle_resize():
+    """Handles SIGWINCH by dropping the game's cached terminal size."""
+    if game:
+        game.invalidate_view_size()
+
 # --- Main Execution ---
 
 async def main():
@@ -713,6 +781,11 @@ async def main():
             except Exception as e:
                  log.error(f"Failed to set fallback signal handler: {e}")
 
+    # Re-read the terminal size only when it actually changes
+    if hasattr(signal, 'SIGWINCH'):
+        loop.add_signal_handler(signal.SIGWINCH, handle_resize)
+        log.debug("Registered signal handler for SIGWINCH")
+
     while restart_count <= max_restarts:
         log.info(f"--- Starting server instance (Attempt {restart_count + 1}/{max_restarts + 1}) ---")
         clean_exit = await start_server()
@@ -765,6 +838,7 @@ async def reload_code():
         
         # Copy over the current game state
         new_game.grid = game.grid
+        new_game._grid_edited()
         new_game.players = game.players
         new_game.generation_count = game.generation_count
         